@@ -1,6 +1,3 @@
-import contextlib
-import csv
-import gzip
 import json
 import os
 import sqlite3
@@ -10,6 +7,8 @@ import tinydb
 
 import neo4j
 
+from imdb_tsv import get_tsvgz_reader
+
 IMDB_BASE_URL = 'https://datasets.imdbws.com'
 IMDB_DIRECTORY = 'imdb'
 IMDB_FILES = {
@@ -91,14 +90,6 @@ KEEP_MOVIE_IDS = ["tt5697572", "tt4877122", "tt0389790", "tt2724064",
 # Useful classes and fucntions:
 ##########
 
-@contextlib.contextmanager
-def get_tsvgz_reader(filename):
-    gzfile = gzip.open(filename, mode='rt', encoding='utf-8')
-    tsv_reader = csv.DictReader(gzfile, delimiter='\t')
-    yield tsv_reader
-    gzfile.close()
-
-
 def positions_to_docs(roles_list, role_name, *, extra_keys=None):
     global people
     docs = []
@@ -157,15 +148,19 @@ class DataObject:
 
 
 class Movie(DataObject):
+    # The TSV columns needed, in the order they are passed to the constructor:
+    COLUMNS = ("tconst", "titleType", "primaryTitle", "isAdult", "startYear", "endYear", "runtimeMinutes", "genres")
+
     def __init__(self, data):
-        self.movie_id = data["tconst"]
-        self.type = data["titleType"]
-        self.title = data["primaryTitle"]
-        self.age_restricted = data["isAdult"] != '0'
-        self.year = int(data["startYear"]) if data["startYear"].isdecimal() else None
-        self.end_year = int(data["endYear"]) if data["endYear"].isdecimal() else None
-        self.duration = int(data["runtimeMinutes"]) if data["runtimeMinutes"].isdecimal() else None
-        self.genres = data["genres"].split(",") if data["genres"] and "\\N" != data["genres"] else []
+        movie_id, title_type, title, is_adult, start_year, end_year, runtime_minutes, genres = data
+        self.movie_id = movie_id
+        self.type = title_type
+        self.title = title
+        self.age_restricted = is_adult != '0'
+        self.year = int(start_year) if start_year.isdecimal() else None
+        self.end_year = int(end_year) if end_year.isdecimal() else None
+        self.duration = int(runtime_minutes) if runtime_minutes.isdecimal() else None
+        self.genres = genres.split(",") if genres and "\\N" != genres else []
 
     def __str__(self):
         return "<Movie:\n\tID: {}\n\tTitle: {}\n\tType: {}\n\tYear: {}\n\tDuration: {} mins\n\tGenres: {}\n>".format(
@@ -173,23 +168,29 @@ class Movie(DataObject):
 
 
 class MovieRating(DataObject):
+    COLUMNS = ("tconst", "averageRating", "numVotes")
+
     def __init__(self, data):
-        self.movie_id = data["tconst"]
-        self.rating = float(data["averageRating"]) if data["averageRating"].replace(".", "", 1).isdecimal() else None
-        self.votes = int(data["numVotes"])
+        movie_id, average_rating, num_votes = data
+        self.movie_id = movie_id
+        self.rating = float(average_rating) if average_rating.replace(".", "", 1).isdecimal() else None
+        self.votes = int(num_votes)
 
     def __str__(self):
         return "<MovieRating: ID={}, Rating={}, Votes={}>".format(self.movie_id, self.rating, self.votes)
 
 
 class MovieRole(DataObject):
+    COLUMNS = ("tconst", "nconst", "category", "job", "characters", "ordering")
+
     def __init__(self, data):
-        self.movie_id = data["tconst"]
-        self.person_id = data["nconst"]
-        self.category = data["category"]
-        self.job = data["job"] if "\\N" != data["job"] else None
-        self.roles = json.loads(data["characters"]) if "\\N" != data["characters"] else []
-        self.position = int(data["ordering"]) if data["ordering"].isdecimal() else None
+        movie_id, person_id, category, job, characters, ordering = data
+        self.movie_id = movie_id
+        self.person_id = person_id
+        self.category = category
+        self.job = job if "\\N" != job else None
+        self.roles = json.loads(characters) if "\\N" != characters else []
+        self.position = int(ordering) if ordering.isdecimal() else None
 
     def __str__(self):
         return "<MovieRole:\n\tMovieID: {}\n\tPersonID: {}\n\tCategory: {}\n\tJob: {}\n\tRoles: {}\n\tPosition: {}\n>".format(
@@ -197,11 +198,14 @@ class MovieRole(DataObject):
 
 
 class Person(DataObject):
+    COLUMNS = ("nconst", "primaryName", "birthYear", "deathYear")
+
     def __init__(self, data):
-        self.person_id = data["nconst"]
-        self.name = data["primaryName"]
-        self.birth_year = int(data["birthYear"]) if data["birthYear"].isdecimal() else None
-        self.death_year = int(data["deathYear"]) if data["deathYear"].isdecimal() else None
+        person_id, name, birth_year, death_year = data
+        self.person_id = person_id
+        self.name = name
+        self.birth_year = int(birth_year) if birth_year.isdecimal() else None
+        self.death_year = int(death_year) if death_year.isdecimal() else None
 
     def __str__(self):
         return "<Person:\n\tID: {}\n\tName: {}\n\tBorn: {}\n\tDied: {}\n>".format(
@@ -234,7 +238,7 @@ for filename in IMDB_FILES.values():
 # Load movie fragments:
 print("[LOAD MOVIE RATINGS]")
 movie_ratings = dict()
-with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["film_ratings"])) as ratings_reader:
+with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["film_ratings"]), MovieRating.COLUMNS) as ratings_reader:
         for i, rating_data in enumerate(ratings_reader):
             rating = MovieRating(rating_data)
             movie_ratings[rating.movie_id] = rating
@@ -245,7 +249,7 @@ print("ratings:", len(movie_ratings))
 # Load movies and filter them:
 print("[LOAD MOVIES]")
 movies = dict()
-with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["film_titles"])) as titles_reader:
+with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["film_titles"]), Movie.COLUMNS) as titles_reader:
     for i, title_data in enumerate(titles_reader):
         movie = Movie(title_data)
         rating = movie_ratings.get(movie.movie_id)
@@ -293,7 +297,7 @@ movie_ratings = None  # Allow some garbage collection!
 print("[LOAD MOVIE PERSONNEL]")
 movie_roles_people = dict()
 movie_roles_movies = dict()
-with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["films_people"])) as films_people_reader:
+with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["films_people"]), MovieRole.COLUMNS) as films_people_reader:
     for film_person_data in films_people_reader:
         role = MovieRole(film_person_data)
         if role.movie_id not in movies:
@@ -324,7 +328,7 @@ print("roles (by movie):", sum([len(roles) for roles in movie_roles_movies.value
 # Load the relevant people:
 print("[LOAD PEOPLE]")
 people = dict()
-with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["people"])) as people_reader:
+with get_tsvgz_reader(os.path.join(IMDB_DIRECTORY, IMDB_FILES["people"]), Person.COLUMNS) as people_reader:
     for person_data in people_reader:
         person = Person(person_data)
 